@@ -14,13 +14,39 @@ Usage with LangChain:
 
 Usage with raw Anthropic API (tool_use):
     See TOOL_SCHEMA below — pass as an entry in `tools=[...]`
+
+Async agents can use fetch_signals_async() / handle_tool_call_async()
+to fetch several merchants concurrently with asyncio.gather().
 """
 
+import asyncio
+import functools
 import json
+import threading
+import time
+import urllib.parse
 import urllib.request
 import urllib.error
-from dataclasses import dataclass, field
-from typing import Optional
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass, field, replace
+from http.client import HTTPMessage
+from typing import Any, Callable, Iterator, Optional
+
+try:
+    # orjson is optional — much faster to parse, and accepts bytes directly.
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so error
+    # handling is the same either way.
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads  # type: ignore[assignment]
+
+try:
+    # urllib3 is optional — when installed, TLS connections are pooled and
+    # kept alive per host instead of re-handshaking on every fetch.
+    import urllib3
+except ImportError:
+    urllib3 = None  # type: ignore[assignment]
 
 # ---------------------------------------------------------------------------
 # Schema
@@ -67,17 +93,56 @@ TOOL_SCHEMA = {
 
 WELL_KNOWN_PATH = "/.well-known/disclose.json"
 FALLBACK_PATH = "/disclose.json"
+_ENDPOINT_PATHS = (WELL_KNOWN_PATH, FALLBACK_PATH)  # Tried in order
 TIMEOUT_SECONDS = 5
+MAX_DOCUMENT_BYTES = 1024 * 1024  # Disclosure documents are a few KB in practice
+REQUEST_HEADERS = {
+    "Accept": "application/json",
+    "User-Agent": "DiscloseFrameworkAgent/0.2 (+https://discloseframework.dev)",
+}
+
+# Shared connection pool (only when urllib3 is installed)
+_pool = (
+    urllib3.PoolManager(
+        num_pools=32,
+        maxsize=64,
+        headers=REQUEST_HEADERS,
+        retries=urllib3.Retry(connect=0, read=0, redirect=5),
+    )
+    if urllib3 else None
+)
+
+# In-process result cache — agents re-query the same merchants across turns
+CACHE_TTL_SECONDS = 60
+CACHE_ERROR_TTL_SECONDS = 5  # Short TTL so transient failures aren't pinned
+CACHE_MAX_ENTRIES = 1024
 
+# Composite score weights, built once rather than on every score() call.
+# (key, max_value, weight, offset, sign) — a lower-is-better signal has
+# offset 1 and sign -1, so score() inverts it without branching on direction
+_SCORE_WEIGHTS = (
+    ("disclose:review_rating",         5.0, 0.35, 0.0,  1.0),
+    ("disclose:product_return_rate",   1.0, 0.25, 1.0, -1.0),
+    ("disclose:chargeback_rate",       1.0, 0.20, 1.0, -1.0),
+    ("disclose:on_time_shipment_rate", 1.0, 0.20, 0.0,  1.0),
+)
 
-@dataclass
+_LEVEL_TAGS = {"signatory": " ✓ signatory", "computed": " ~ computed", "none": ""}
+
+
+@dataclass(slots=True, frozen=True)
 class DiscloseSignals:
-    """Parsed signals from a merchant's Disclose endpoint."""
+    """
+    Parsed signals from a merchant's Disclose endpoint.
+
+    Instances are slotted and frozen: results are shared through the
+    cache, so they carry no per-instance __dict__ and their fields can't
+    be reassigned. The dicts and lists they hold are still mutable.
+    """
 
     merchant_domain: str
-    raw: dict = field(repr=False)
-    attributes: dict = field(default_factory=dict)
-    attestations: list = field(default_factory=list)
+    attributes: dict[str, Any] = field(default_factory=dict)
+    attestations: list[dict[str, Any]] = field(default_factory=list)
     error: Optional[str] = None
 
     def attested_by(self) -> list[str]:
@@ -107,36 +172,35 @@ class DiscloseSignals:
         """Human/LLM-readable summary of signals for prompt injection."""
         if self.error:
             return f"[Disclose] Could not retrieve signals for {self.merchant_domain}: {self.error}"
+        return "\n".join(self._summary_lines())
 
-        lines = [f"[Disclose signals for {self.merchant_domain}]"]
+    def _summary_lines(self) -> Iterator[str]:
+        yield f"[Disclose signals for {self.merchant_domain}]"
 
         signatories = self.attested_by()
         if signatories:
-            lines.append(f"  Attested by: {', '.join(signatories)}")
+            yield f"  Attested by: {', '.join(signatories)}"
 
         for key, signal in self.attributes.items():
             # Skip _period_days companion fields from summary display
             if key.endswith("_period_days"):
                 continue
 
-            short_key = key.replace("disclose:", "")
+            short_key = _short_key(key)
 
             # Handle new signal object structure
             if isinstance(signal, dict):
                 value = signal.get("value")
-                level = signal.get("attestation_level", "none")
-                level_tag = {"signatory": " ✓ signatory", "computed": " ~ computed", "none": ""}.get(level, "")
+                level_tag = _LEVEL_TAGS.get(signal.get("attestation_level", "none"), "")
             else:
                 # Flat value fallback for older documents
                 value = signal
                 level_tag = " ✓" if self.is_attested(key) else ""
 
-            lines.append(f"  {short_key}: {_format_value(short_key, value)}{level_tag}")
+            yield f"  {short_key}: {_format_value(short_key, value)}{level_tag}"
 
         if not self.attributes:
-            lines.append("  No signals published.")
-
-        return "\n".join(lines)
+            yield "  No signals published."
 
     def score(self) -> Optional[float]:
         """
@@ -145,33 +209,16 @@ class DiscloseSignals:
 
         Returns None if insufficient data.
         """
-        weights = {
-            # (max_value, weight) — negative weight means lower is better
-            "disclose:review_rating":         (5.0,   0.35),
-            "disclose:product_return_rate":   (1.0,  -0.25),
-            "disclose:chargeback_rate":       (1.0,  -0.20),
-            "disclose:on_time_shipment_rate": (1.0,   0.20),
-        }
         score = 0.0
         total_weight = 0.0
 
-        for key, (max_val, w) in weights.items():
-            signal = self.attributes.get(key)
-            if signal is None:
-                continue
-
-            # Unwrap signal object or use flat value
-            val = signal.get("value") if isinstance(signal, dict) else signal
-            if val is None:
-                continue
-
-            normalized = float(val) / max_val
-            if w < 0:
-                # Invert: lower value → higher score contribution
-                score += abs(w) * (1 - normalized)
-            else:
-                score += w * normalized
-            total_weight += abs(w)
+        for key, max_val, w, offset, sign in _SCORE_WEIGHTS:
+            # Unwrap signal object or use flat value (missing → None)
+            val = get_signal_value(self.attributes.get(key))
+            if val is not None:
+                # Lower-is-better rows contribute w * (1 - normalized)
+                score += w * (offset + sign * (float(val) / max_val))
+                total_weight += w
 
         return round(score / total_weight, 3) if total_weight > 0 else None
 
@@ -191,91 +238,350 @@ def fetch_signals(
     Returns:
         DiscloseSignals dataclass with parsed data.
     """
-    domain = merchant_domain.rstrip("/").removeprefix("https://").removeprefix("http://")
+    domain = normalize_domain(merchant_domain)
+    wanted = frozenset(signals) if signals else None
 
-    raw = None
+    attributes = None
+    attestations: list[dict[str, Any]] = []
     last_error = None
 
-    for path in [WELL_KNOWN_PATH, FALLBACK_PATH]:
+    for path in _ENDPOINT_PATHS:
         url = f"https://{domain}{path}"
         try:
-            req = urllib.request.Request(
-                url,
-                headers={
-                    "Accept": "application/json",
-                    "User-Agent": "DiscloseFrameworkAgent/0.2 (+https://discloseframework.dev)",
-                },
-            )
-            with urllib.request.urlopen(req, timeout=TIMEOUT_SECONDS) as resp:
-                raw = json.loads(resp.read().decode())
+            # Revalidate a previously seen document instead of re-downloading it
+            with _cache_lock:
+                known = _validated.get(url)
+            conditional = {}
+            if known is not None:
+                etag, last_modified, _, _ = known
+                if etag:
+                    conditional["If-None-Match"] = etag
+                if last_modified:
+                    conditional["If-Modified-Since"] = last_modified
+
+            status, validators, body = _http_get(url, conditional)
+            if status == 304 and known is not None:
+                # Not Modified — reuse the previously extracted signals.
+                # Both are copied so callers never share the stored ones.
+                _, _, all_attributes, stored_attestations = known
+                attributes = _filter_attributes(all_attributes, wanted)
+                attestations = list(stored_attestations)
+                with _cache_lock:
+                    if url in _validated:
+                        _validated.move_to_end(url)
+                break
+            if len(body) > MAX_DOCUMENT_BYTES:
+                return DiscloseSignals(
+                    merchant_domain=domain,
+                    error=f"Disclosure document exceeds {MAX_DOCUMENT_BYTES} bytes"
+                )
+            raw = _json_loads(body)
+            attestations = raw.get("attestations", [])
+
+            etag, last_modified = validators.get("ETag"), validators.get("Last-Modified")
+            if etag or last_modified:
+                # Keep only the extracted signals for revalidation, not the
+                # document — unfiltered, so any later filter can be served.
+                # The returned attributes are a filtered copy of them.
+                all_attributes = _extract_attributes(raw)
+                attributes = _filter_attributes(all_attributes, wanted)
+                stored = (etag, last_modified, all_attributes, list(attestations))
+                with _cache_lock:
+                    _validated.pop(url, None)
+                    _validated[url] = stored
+                    while len(_validated) > CACHE_MAX_ENTRIES:
+                        _validated.popitem(last=False)
+            else:
+                attributes = _extract_attributes(raw, wanted)
             break  # Success — stop trying paths
         except urllib.error.HTTPError as e:
             if e.code == 404:
                 last_error = f"HTTP 404 at {path}"
                 continue  # Try fallback path
             return DiscloseSignals(
-                merchant_domain=domain, raw={},
+                merchant_domain=domain,
                 error=f"HTTP {e.code}: merchant may not support Disclose Framework"
             )
         except urllib.error.URLError as e:
-            return DiscloseSignals(merchant_domain=domain, raw={}, error=str(e.reason))
+            return DiscloseSignals(merchant_domain=domain, error=str(e.reason))
         except json.JSONDecodeError:
-            return DiscloseSignals(merchant_domain=domain, raw={}, error="Invalid JSON at endpoint")
+            return DiscloseSignals(merchant_domain=domain, error="Invalid JSON at endpoint")
         except Exception as e:
-            return DiscloseSignals(merchant_domain=domain, raw={}, error=str(e))
+            return DiscloseSignals(merchant_domain=domain, error=str(e))
 
-    if raw is None:
+    if attributes is None:
         return DiscloseSignals(
-            merchant_domain=domain, raw={},
+            merchant_domain=domain,
             error=last_error or "Disclosure document not found at canonical or fallback path"
         )
 
-    all_attributes = _extract_attributes(raw)
+    return DiscloseSignals(
+        merchant_domain=domain,
+        attributes=attributes,
+        attestations=attestations,
+    )
+
+
+def _http_get(
+    url: str,
+    extra_headers: Optional[dict[str, str]] = None,
+) -> tuple[int, dict[str, str], bytes]:
+    """
+    GET a URL and return (status, validators, body), reading at most
+    MAX_DOCUMENT_BYTES + 1 bytes of the body. `validators` holds the
+    response's ETag / Last-Modified headers, if any. A 304 Not Modified
+    is returned as a status with an empty body.
+
+    Uses the pooled urllib3 connections when available, plain urlopen
+    otherwise — and also whenever a proxy applies to the URL, since the
+    pool does not read http(s)_proxy / no_proxy. Either way, failures
+    surface as urllib.error.HTTPError / URLError so callers handle a
+    single set of exceptions.
+    """
+    headers = {**REQUEST_HEADERS, **extra_headers} if extra_headers else REQUEST_HEADERS
+
+    if _pool is None or _proxied(url):
+        req = urllib.request.Request(url, headers=headers)
+        try:
+            with urllib.request.urlopen(req, timeout=TIMEOUT_SECONDS) as resp:
+                # Bounded read — never buffer more than MAX_DOCUMENT_BYTES
+                body = resp.read(MAX_DOCUMENT_BYTES + 1)
+                return resp.status, _validators(resp.headers), body
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return 304, _validators(e.headers), b""
+            raise
 
-    filtered = (
-        {k: v for k, v in all_attributes.items() if k in signals}
-        if signals else all_attributes
+    try:
+        resp = _pool.request(
+            "GET", url, headers=headers, timeout=TIMEOUT_SECONDS, preload_content=False,
+        )
+        try:
+            if resp.status >= 400:
+                resp.drain_conn()
+                raise urllib.error.HTTPError(url, resp.status, resp.reason or "", HTTPMessage(), None)
+            body = resp.read(MAX_DOCUMENT_BYTES + 1)
+            if len(body) > MAX_DOCUMENT_BYTES:
+                resp.close()  # Partially read — don't hand the connection back for reuse
+            return resp.status, _validators(resp.headers), body
+        finally:
+            resp.release_conn()
+    except urllib3.exceptions.HTTPError as e:
+        raise urllib.error.URLError(getattr(e, "reason", None) or e) from e
+
+
+def _validators(headers: Any) -> dict[str, str]:
+    """ETag / Last-Modified from either transport's (case-insensitive) headers."""
+    return {name: headers[name] for name in ("ETag", "Last-Modified") if headers.get(name)}
+
+
+def _proxied(url: str) -> bool:
+    """True if urllib's proxy settings (e.g. https_proxy / no_proxy) route this URL."""
+    parts = urllib.parse.urlsplit(url)
+    return (
+        parts.scheme in urllib.request.getproxies()
+        and not urllib.request.proxy_bypass(parts.hostname or "")
     )
 
-    return DiscloseSignals(
-        merchant_domain=domain,
-        raw=raw,
-        attributes=filtered,
-        attestations=raw.get("attestations", []),
+
+@dataclass(slots=True)
+class _CacheEntry:
+    """A cached result; its summary() text is rendered on first use."""
+
+    expires_at: float
+    result: DiscloseSignals
+    summary: Optional[str] = None
+
+
+# (normalized domain, sorted signal filter or None)
+_CacheKey = tuple[str, Optional[tuple[str, ...]]]
+
+# (ETag, Last-Modified, unfiltered attributes, attestations)
+_Validated = tuple[Optional[str], Optional[str], dict[str, Any], list[dict[str, Any]]]
+
+# url -> _Validated, for conditional re-fetches. Least recently used
+# entries are evicted first.
+_validated: "OrderedDict[str, _Validated]" = OrderedDict()
+
+_cache: "OrderedDict[_CacheKey, _CacheEntry]" = OrderedDict()
+
+# key -> Future for a fetch in progress, so concurrent misses fetch only once
+_inflight: "dict[_CacheKey, Future[_CacheEntry]]" = {}
+
+# Guards _cache, _inflight and _validated — fetch_signals_async() runs the
+# cached fetch from worker threads. Never held across network I/O.
+_cache_lock = threading.Lock()
+
+
+def fetch_signals_cached(
+    merchant_domain: str,
+    signals: Optional[list[str]] = None,
+) -> DiscloseSignals:
+    """
+    Same as fetch_signals(), but serves repeat calls from an in-process
+    TTL cache. Successful results live for CACHE_TTL_SECONDS, errors for
+    CACHE_ERROR_TTL_SECONDS. At most CACHE_MAX_ENTRIES results are kept,
+    evicting the least recently used.
+    """
+    return _cache_entry(merchant_domain, signals).result
+
+
+def _cached_summary(merchant_domain: str, signals: Optional[list[str]] = None) -> str:
+    """
+    summary() of the cached result. The text is rendered once per cache
+    entry, so repeat tool calls skip both the fetch and the formatting.
+    """
+    entry = _cache_entry(merchant_domain, signals)
+    if entry.summary is None:
+        entry.summary = entry.result.summary()
+    return entry.summary
+
+
+def _cache_entry(merchant_domain: str, signals: Optional[list[str]]) -> _CacheEntry:
+    """Returns the live cache entry for a request, fetching on a miss."""
+    key: _CacheKey = (
+        normalize_domain(merchant_domain),
+        tuple(sorted(signals)) if signals else None,
     )
+    wanted = frozenset(signals) if signals else None
+    with _cache_lock:
+        now = time.monotonic()
+        entry = _cache.get(key)
+        if entry is not None:
+            if now <= entry.expires_at:
+                _cache.move_to_end(key)
+                return entry
+            del _cache[key]
+
+        # A live unfiltered entry (e.g. from a prefetch) can answer a filtered
+        # request without going back to the network
+        full = _cache.get((key[0], None))
+        if wanted is not None and full is not None and now <= full.expires_at:
+            result = replace(
+                full.result,
+                attributes=_filter_attributes(full.result.attributes, wanted),
+            )
+            entry = _CacheEntry(full.expires_at, result)
+            _store_entry(key, entry)
+            return entry
+
+        # Join a fetch another thread already started for this key
+        pending = _inflight.get(key)
+        if pending is None:
+            pending = _inflight[key] = Future()
+            owner = True
+        else:
+            owner = False
+
+    if not owner:
+        return pending.result()
+
+    try:
+        result = fetch_signals(key[0], signals)
+        ttl = CACHE_ERROR_TTL_SECONDS if result.error else CACHE_TTL_SECONDS
+        entry = _CacheEntry(time.monotonic() + ttl, result)
+        with _cache_lock:
+            _store_entry(key, entry)
+            del _inflight[key]
+    except BaseException as e:
+        with _cache_lock:
+            del _inflight[key]
+        pending.set_exception(e)
+        raise
+    pending.set_result(entry)
+    return entry
+
+
+def _store_entry(key: _CacheKey, entry: _CacheEntry) -> None:
+    """Insert a cache entry, evicting least recently used. Caller holds _cache_lock."""
+    _cache[key] = entry
+    while len(_cache) > CACHE_MAX_ENTRIES:
+        _cache.popitem(last=False)
+
+
+async def fetch_signals_async(
+    merchant_domain: str,
+    signals: Optional[list[str]] = None,
+) -> DiscloseSignals:
+    """
+    Async variant of fetch_signals_cached(). The blocking fetch runs in a
+    worker thread, so several merchants can be fetched concurrently with
+    asyncio.gather() — N lookups cost roughly one round-trip, not N.
+    """
+    return await asyncio.to_thread(fetch_signals_cached, merchant_domain, signals)
+
+
+def clear_cache() -> None:
+    """Drops all cached results and stored ETag / Last-Modified validators."""
+    with _cache_lock:
+        _cache.clear()
+        _validated.clear()
 
 
-def _extract_attributes(raw: dict) -> dict:
+def normalize_domain(merchant_domain: str) -> str:
+    """
+    Strip scheme and trailing slashes and lowercase, leaving the bare
+    domain. Hostnames are case-insensitive, so 'Fully.com' and 'fully.com'
+    share one cache entry.
+    """
+    if "/" not in merchant_domain:
+        return merchant_domain.lower()  # Already bare — the common case
+    return merchant_domain.rstrip("/").removeprefix("https://").removeprefix("http://").lower()
+
+
+def _extract_attributes(
+    raw: dict[str, Any],
+    wanted: Optional[frozenset[str]] = None,
+) -> dict[str, Any]:
     """
     Extract disclose: namespaced keys from a disclosure document.
 
     Handles both:
     - New signal object structure: {"value": 0.06, "attestation_level": "signatory", ...}
     - Legacy flat structure: {"disclose:product_return_rate": 0.06}
-    """
-    attributes = {}
 
+    If `wanted` is given, only those keys are extracted — the filter is
+    applied while walking the document rather than on a second dict.
+    """
     # Primary: attributes object (new signal object structure or legacy flat)
-    for k, v in raw.get("attributes", {}).items():
-        if k.startswith("disclose:"):
-            attributes[k] = v
+    attributes = {
+        k: v for k, v in raw.get("attributes", {}).items()
+        if k.startswith("disclose:") and (wanted is None or k in wanted)
+    }
 
     # Also support bare disclose: keys at root (JSON-LD format)
     for k, v in raw.items():
-        if k.startswith("disclose:") and k not in attributes:
+        if k.startswith("disclose:") and k not in attributes and (wanted is None or k in wanted):
             attributes[k] = v
 
-    # Support @graph nodes (JSON-LD multi-scope documents)
-    for node in raw.get("@graph", []):
-        if isinstance(node, dict):
-            for k, v in node.items():
-                if k.startswith("disclose:") and k not in attributes:
-                    attributes[k] = v
+    # Support @graph nodes (JSON-LD multi-scope documents) — most documents
+    # have none, so skip the loop entirely when absent or empty
+    graph = raw.get("@graph")
+    if graph:
+        for node in graph:
+            # Parsed JSON only yields plain dicts, so an exact type check suffices
+            if type(node) is dict:
+                for k, v in node.items():
+                    if k.startswith("disclose:") and k not in attributes and (wanted is None or k in wanted):
+                        attributes[k] = v
 
     return attributes
 
 
-def get_signal_value(signal) -> Optional[float]:
+def _filter_attributes(
+    attributes: dict[str, Any],
+    wanted: Optional[frozenset[str]],
+) -> dict[str, Any]:
+    """
+    Subset of already-extracted attributes, keeping document order.
+    Always a new dict, so callers can't mutate the one passed in.
+    """
+    if wanted is None:
+        return dict(attributes)
+    return {k: v for k, v in attributes.items() if k in wanted}
+
+
+def get_signal_value(signal: Any) -> Optional[float]:
     """
     Safely extract the scalar value from a signal, whether it is
     a new signal object or a legacy flat value.
@@ -285,25 +591,55 @@ def get_signal_value(signal) -> Optional[float]:
     return signal
 
 
-def _format_value(key: str, value) -> str:
-    """Format attribute values for human-readable summary output."""
-    if value is None:
-        return "n/a"
-    rate_keys = {
-        "product_return_rate", "chargeback_rate", "dispute_win_rate",
-        "on_time_shipment_rate", "delivered_on_time_rate", "order_accuracy_rate",
-        "in_stock_rate", "inventory_accuracy_rate", "review_verified_purchase_rate",
-        "first_contact_resolution_rate", "returnless_refund_rate",
-    }
-    if key in rate_keys:
-        return f"{float(value)*100:.1f}%"
+_RATE_KEYS = frozenset({
+    "product_return_rate", "chargeback_rate", "dispute_win_rate",
+    "on_time_shipment_rate", "delivered_on_time_rate", "order_accuracy_rate",
+    "in_stock_rate", "inventory_accuracy_rate", "review_verified_purchase_rate",
+    "first_contact_resolution_rate", "returnless_refund_rate",
+})
+
+
+def _format_rate(value: Any) -> str:
+    return f"{float(value)*100:.1f}%"
+
+
+def _format_rating(value: Any) -> str:
+    return f"{value}/5.0"
+
+
+def _format_days(value: Any) -> str:
+    return f"{value} days"
+
+
+def _format_hours(value: Any) -> str:
+    return f"{value} hrs"
+
+
+@functools.lru_cache(maxsize=256)
+def _short_key(key: str) -> str:
+    """Display form of an attribute key, computed once per key."""
+    return key.removeprefix("disclose:")
+
+
+@functools.lru_cache(maxsize=256)
+def _formatter_for(key: str) -> Callable[[Any], str]:
+    """Resolve the formatter for a short key once; repeat keys are a cache hit."""
+    if key in _RATE_KEYS:
+        return _format_rate
     if key == "review_rating":
-        return f"{value}/5.0"
+        return _format_rating
     if "days" in key:
-        return f"{value} days"
+        return _format_days
     if "hours" in key:
-        return f"{value} hrs"
-    return str(value)
+        return _format_hours
+    return str
+
+
+def _format_value(key: str, value: Any) -> str:
+    """Format attribute values for human-readable summary output."""
+    if value is None:
+        return "n/a"
+    return _formatter_for(key)(value)
 
 
 # ---------------------------------------------------------------------------
@@ -324,11 +660,10 @@ try:
         args_schema = _DiscloseInput
 
         def _run(self, merchant_domain: str, signals: Optional[list[str]] = None) -> str:
-            result = fetch_signals(merchant_domain, signals)
-            return result.summary()
+            return _cached_summary(merchant_domain, signals)
 
-        async def _arun(self, *args, **kwargs):
-            raise NotImplementedError("Use async fetch wrapper if needed")
+        async def _arun(self, merchant_domain: str, signals: Optional[list[str]] = None) -> str:
+            return await asyncio.to_thread(_cached_summary, merchant_domain, signals)
 
 except ImportError:
     pass  # LangChain not installed — that's fine
@@ -338,7 +673,7 @@ except ImportError:
 # Anthropic tool_use handler
 # ---------------------------------------------------------------------------
 
-def handle_tool_call(tool_name: str, tool_input: dict) -> str:
+def handle_tool_call(tool_name: str, tool_input: dict[str, Any]) -> str:
     """
     Drop-in handler for Anthropic API tool_use blocks.
 
@@ -349,11 +684,24 @@ def handle_tool_call(tool_name: str, tool_input: dict) -> str:
     """
     if tool_name != "fetch_merchant_trust_signals":
         return f"Unknown tool: {tool_name}"
-    result = fetch_signals(
+    return _cached_summary(
+        merchant_domain=tool_input["merchant_domain"],
+        signals=tool_input.get("signals"),
+    )
+
+
+async def handle_tool_call_async(tool_name: str, tool_input: dict[str, Any]) -> str:
+    """
+    Async counterpart of handle_tool_call(). Gather several of these to
+    service all tool_use blocks of a turn concurrently.
+    """
+    if tool_name != "fetch_merchant_trust_signals":
+        return f"Unknown tool: {tool_name}"
+    return await asyncio.to_thread(
+        _cached_summary,
         merchant_domain=tool_input["merchant_domain"],
         signals=tool_input.get("signals"),
     )
-    return result.summary()
 
 
 # ---------------------------------------------------------------------------
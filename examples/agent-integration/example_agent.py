@@ -4,12 +4,31 @@ example_agent.py
 Shows how to wire fetch_merchant_trust_signals into a Claude-powered
 shopping agent using the Anthropic API tool_use pattern.
 This is the reference integration pattern agent developers should follow.
+
+All tool_use blocks in a turn are serviced concurrently, so comparing
+several merchants costs roughly one network round-trip instead of one
+per merchant. Responses are streamed, and each merchant's fetch starts
+as soon as its merchant_domain argument has been generated — overlapping
+network latency with the rest of the model's output. Domains mentioned in
+the user's message are fetched speculatively before the first model call
+returns, so those lookups are usually cache hits by the time they're used.
 """
+import asyncio
+import json
+import re
+from typing import Any, Optional
+
 import anthropic
-from disclose_tool import TOOL_SCHEMA, handle_tool_call
+from disclose_tool import (
+    TOOL_SCHEMA, fetch_signals_async, handle_tool_call_async, normalize_domain,
+)
 
-client = anthropic.Anthropic()
+client = anthropic.AsyncAnthropic()
 MODEL = "claude-sonnet-4-6"
+TOOLS = [TOOL_SCHEMA]  # Built once and reused on every turn
+
+# Bare domains mentioned in free text, e.g. "upliftdesk.com" or "shop.fully.com"
+_DOMAIN_RE = re.compile(r"\b(?:[a-z0-9](?:[a-z0-9-]*[a-z0-9])?\.)+[a-z]{2,}\b", re.IGNORECASE)
 
 SYSTEM_PROMPT = """You are a shopping agent helping users make purchases.
 Before recommending a merchant or completing any purchase, you MUST call
@@ -31,17 +50,87 @@ confidence. Never fabricate signals.
 """
 
 
-def run_shopping_agent(user_message: str):
-    messages = [{"role": "user", "content": user_message}]
+class _ToolInputScanner:
+    """
+    Push-based scanner for streamed tool_use argument JSON.
+
+    feed() takes each input_json_delta chunk and returns the top-level
+    string fields completed within it. Every character is looked at once,
+    so the accumulated JSON is never re-parsed as it grows.
+    """
+
+    def __init__(self) -> None:
+        self.fields: dict[str, str] = {}
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._capture = False  # Current string is a top-level key or value
+        self._chars: list[str] = []  # Its characters so far, still JSON-escaped
+        self._key: Optional[str] = None  # Top-level key awaiting its value
+
+    def feed(self, chunk: str) -> dict[str, str]:
+        completed: dict[str, str] = {}
+        for ch in chunk:
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._capture:
+                        text = json.loads(f'"{"".join(self._chars)}"')
+                        if self._key is None:
+                            self._key = text
+                        else:
+                            self.fields[self._key] = completed[self._key] = text
+                            self._key = None
+                    continue
+                if self._capture:
+                    self._chars.append(ch)
+            elif ch == '"':
+                self._in_string = True
+                self._capture = self._depth == 1
+                self._chars = []
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+            elif ch == "," and self._depth == 1:
+                self._key = None  # Previous value was not a string
+        return completed
+
+
+async def run_shopping_agent(user_message: str) -> None:
+    messages: list[dict[str, Any]] = [{"role": "user", "content": user_message}]
+
+    # Speculatively fetch merchants named by the user while the model is
+    # still generating — keyed by normalized domain so each starts only once
+    prefetches = {
+        domain: asyncio.create_task(fetch_signals_async(domain))
+        for domain in dict.fromkeys(map(normalize_domain, _DOMAIN_RE.findall(user_message)))
+    }
 
     while True:
-        response = client.messages.create(
+        scanner = _ToolInputScanner()
+        async with client.messages.stream(
             model=MODEL,
             max_tokens=1024,
             system=SYSTEM_PROMPT,
-            tools=[TOOL_SCHEMA],
+            tools=TOOLS,
             messages=messages,
-        )
+        ) as stream:
+            async for event in stream:
+                if event.type == "content_block_start" and event.content_block.type == "tool_use":
+                    scanner = _ToolInputScanner()
+                elif event.type == "content_block_delta" and event.delta.type == "input_json_delta":
+                    domain = scanner.feed(event.delta.partial_json).get("merchant_domain")
+                    if domain:
+                        domain = normalize_domain(domain)
+                    if domain and domain not in prefetches:
+                        # Start fetching while the model is still writing the rest of the call
+                        prefetches[domain] = asyncio.create_task(fetch_signals_async(domain))
+            response = await stream.get_final_message()
 
         # Collect text output
         for block in response.content:
@@ -54,17 +143,31 @@ def run_shopping_agent(user_message: str):
 
         # Handle tool calls
         if response.stop_reason == "tool_use":
+            blocks = [block for block in response.content if block.type == "tool_use"]
+            for block in blocks:
+                print(f"\n[Fetching Disclose signals for: {block.input.get('merchant_domain')}]")
+
+            # Let this turn's prefetches land in the cache — speculative fetches
+            # for merchants the model didn't ask about are left running — then
+            # fetch anything still missing concurrently
+            requested = {
+                normalize_domain(block.input.get("merchant_domain", "")) for block in blocks
+            }
+            await asyncio.gather(*[
+                prefetches[domain] for domain in requested if domain in prefetches
+            ])
+            results = await asyncio.gather(*[
+                handle_tool_call_async(block.name, block.input) for block in blocks
+            ])
+
             tool_results = []
-            for block in response.content:
-                if block.type == "tool_use":
-                    print(f"\n[Fetching Disclose signals for: {block.input.get('merchant_domain')}]")
-                    result = handle_tool_call(block.name, block.input)
-                    print(result)
-                    tool_results.append({
-                        "type": "tool_result",
-                        "tool_use_id": block.id,
-                        "content": result,
-                    })
+            for block, result in zip(blocks, results):
+                print(result)
+                tool_results.append({
+                    "type": "tool_result",
+                    "tool_use_id": block.id,
+                    "content": result,
+                })
 
             # Append assistant turn + tool results
             messages.append({"role": "assistant", "content": response.content})
@@ -74,8 +177,8 @@ def run_shopping_agent(user_message: str):
 
 
 if __name__ == "__main__":
-    run_shopping_agent(
+    asyncio.run(run_shopping_agent(
         "I want to buy a standing desk. I've found two options: "
         "one from upliftdesk.com and one from fully.com. "
         "Which merchant should I trust more?"
-    )
+    ))